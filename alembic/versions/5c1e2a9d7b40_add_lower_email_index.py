@@ -0,0 +1,28 @@
+"""Add case-insensitive email index
+
+Revision ID: 5c1e2a9d7b40
+Revises: 10f85f362345
+Create Date: 2026-10-15 17:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e2a9d7b40'
+down_revision: Union[str, None] = '10f85f362345'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backs UserService.get_by_email, which matches lower(email) so rows stored before
+    # emails were lowercased on write keep working.
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 Base = declarative_base()
 
@@ -9,10 +10,21 @@ class Database:
     _session_factory = None
 
     @classmethod
-    def initialize(cls, database_url: str, echo: bool = False):
-        """Initialize the async engine and sessionmaker."""
+    def initialize(cls, database_url: str, echo: bool = False, pool_size: int = 10, max_overflow: int = 20,
+                   pool_timeout: int = 30, pool_recycle: int = 1800):
+        """Initialize the async engine, with a pool of reusable connections, and the sessionmaker."""
         if cls._engine is None:  # Ensure engine is created once
-            cls._engine = create_async_engine(database_url, echo=echo, future=True)
+            cls._engine = create_async_engine(
+                database_url,
+                echo=echo,
+                future=True,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=True,
+            )
             cls._session_factory = sessionmaker(
                 bind=cls._engine, class_=AsyncSession, expire_on_commit=False, future=True
             )
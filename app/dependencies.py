@@ -1,5 +1,8 @@
+import logging
+from functools import lru_cache
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import Database
 from app.utils.template_manager import TemplateManager
@@ -8,17 +11,20 @@ from settings.config import Settings
 from app.services.jwt_service import decode_token
 from app.models.user_model import UserRole
 
-# Import the User class here to fix the NameError
-from app.models.user_model import User  # <-- Add this import to resolve the NameError
+logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Return application settings."""
+    """Return application settings, built once and shared across requests."""
     return Settings()
 
+# EmailService and its TemplateManager hold no per-request state, so a single
+# instance is shared instead of being rebuilt on every dependency resolution.
+_EMAIL_SERVICE = EmailService(template_manager=TemplateManager())
+
 def get_email_service() -> EmailService:
     """Get the email service dependency."""
-    template_manager = TemplateManager()
-    return EmailService(template_manager=template_manager)
+    return _EMAIL_SERVICE
 
 async def get_db() -> AsyncSession:
     """Dependency that provides a database session for each request."""
@@ -32,50 +38,83 @@ async def get_db() -> AsyncSession:
 # OAuth2PasswordBearer is used to handle the OAuth2 password flow
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+def _credentials_exception() -> HTTPException:
     """
-    Get the current user based on the provided OAuth2 token.
-    This will verify the token and fetch the user's information from the database.
+    Build the 401 raised whenever a token cannot be validated. Both the exception and its
+    headers dict are new on every call: a shared instance would keep chaining tracebacks,
+    and a shared headers dict could leak a handler's mutations into later responses.
     """
-    credentials_exception = HTTPException(
+    return HTTPException(
         status_code=401,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> Row:
+    """
+    Get the current user based on the provided OAuth2 token.
+    This will verify the token and fetch the user's identity (id, role and lock flag)
+    from the database. Locked or deleted accounts are rejected even while their token is
+    valid, which covers every route guarded by require_role (the data-changing admin routes).
+    """
     # Decode the token to get user information
     payload = decode_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
-    user_id: str = payload.get("sub")
-    user_role: str = payload.get("role")
+    # decode_token only returns payloads carrying "sub", "role" and "exp"
+    user_id: str = payload["sub"]
 
-    print(f"Decoded token: {payload}")  # Debugging: Add this for debugging
-
-    if user_id is None or user_role is None:
-        raise credentials_exception
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Decoded token: {payload}")
 
     # Lazy import UserService here to avoid circular import issues
     from app.services.user_service import UserService  # Move import here to avoid circular import
 
-    # Fetch the user from the database using UserService
-    user = await UserService.get_by_id(db, user_id)
-    if not user:
-        raise credentials_exception
+    # Fetch only the identity columns; routes needing the full row load it themselves
+    user = await UserService.get_identity(db, user_id)
+    if not user or user.is_locked:
+        raise _credentials_exception()
 
     return user
 
+async def get_token_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Verify the OAuth2 token and return its claims without touching the database.
+    """
+    payload = decode_token(token)
+    if payload is None:
+        raise _credentials_exception()
+    return payload
+
 
 def require_role(roles: list):
     """
     Dependency that checks if the current user has one of the required roles.
     If the user does not have the required role, a 403 error is raised.
     """
-    def role_checker(current_user: User = Depends(get_current_user)):  # Ensure current_user is typed as User
-        print(f"User Role: {current_user.role}")  # Debugging line
-        allowed_roles = [UserRole[role] for role in roles]  # Convert strings to UserRole enum values
+    # Convert role names to UserRole members once, when the dependency is declared
+    allowed_roles = frozenset(UserRole(role) for role in roles)
+
+    async def role_checker(current_user: Row = Depends(get_current_user)):  # Identity row from get_current_user
         if current_user.role not in allowed_roles:  # Compare Enum values
             raise HTTPException(status_code=403, detail="Operation not permitted")
         return current_user
-    return role_checker
\ No newline at end of file
+    return role_checker
+
+
+def require_role_from_token(roles: list):
+    """
+    Dependency that checks the role claim of the verified token against the required roles.
+    Unlike require_role it does not load the user and returns the token claims instead.
+    The trade-off: a user who is locked, deleted or demoted keeps the role in their token
+    until it expires, so use this only on read-only endpoints and keep require_role on
+    endpoints that change data.
+    """
+    allowed_roles = frozenset(UserRole(role) for role in roles)
+
+    async def role_checker(claims: dict = Depends(get_token_claims)):
+        if claims["role"] not in allowed_roles:  # UserRole members compare equal to their names
+            raise HTTPException(status_code=403, detail="Operation not permitted")
+        return claims
+    return role_checker
@@ -1,17 +1,20 @@
 from builtins import bool, int, str
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import uuid
 from sqlalchemy import (
-    Column, String, Integer, DateTime, Boolean, func, Enum as SQLAlchemyEnum
+    Index, String, Integer, DateTime, Boolean, func, Enum as SQLAlchemyEnum
 )
 from sqlalchemy.dialects.postgresql import UUID, ENUM
 from sqlalchemy.orm import Mapped, mapped_column
 from app.database import Base
 
-class UserRole(Enum):
-    """Enumeration of user roles within the application, stored as ENUM in the database."""
+class UserRole(str, Enum):
+    """
+    Enumeration of user roles within the application, stored as ENUM in the database.
+    Members are also strings, so they compare equal to the role names carried in JWT claims.
+    """
     ANONYMOUS = "ANONYMOUS"
     AUTHENTICATED = "AUTHENTICATED"
     MANAGER = "MANAGER"
@@ -19,6 +22,11 @@ class UserRole(Enum):
 
 
 
+def _utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 class User(Base):
     """
     Represents a user within the application, corresponding to the 'users' table in the database.
@@ -43,8 +51,8 @@ class User(Base):
         last_login_at (datetime): Timestamp of the last login.
         failed_login_attempts (int): Count of failed login attempts.
         is_locked (bool): Flag indicating if the account is locked.
-        created_at (datetime): Timestamp when the user was created, set by the server.
-        updated_at (datetime): Timestamp of the last update, set by the server.
+        created_at (datetime): Timestamp when the user was created.
+        updated_at (datetime): Timestamp of the last update.
 
     Methods:
         lock_account(): Locks the user account.
@@ -54,29 +62,30 @@ class User(Base):
         update_professional_status(status): Updates the professional status and logs the update time.
     """
     __tablename__ = "users"
-    __mapper_args__ = {"eager_defaults": True}
+    __mapper_args__ = {"confirm_deleted_rows": False}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    nickname: Mapped[str] = Column(String(50), unique=True, nullable=False, index=True)
-    email: Mapped[str] = Column(String(255), unique=True, nullable=False, index=True)
-    first_name: Mapped[str] = Column(String(100), nullable=True)
-    last_name: Mapped[str] = Column(String(100), nullable=True)
-    bio: Mapped[str] = Column(String(500), nullable=True)
-    profile_picture_url: Mapped[str] = Column(String(255), nullable=True)
-    linkedin_profile_url: Mapped[str] = Column(String(255), nullable=True)
-    github_profile_url: Mapped[str] = Column(String(255), nullable=True)
-    location: Mapped[Optional[str]] = Column(String(255), nullable=True)  # Add location field
-    role: Mapped[UserRole] = Column(SQLAlchemyEnum(UserRole, name='UserRole', create_constraint=True), nullable=False)
-    is_professional: Mapped[bool] = Column(Boolean, default=False)
-    professional_status_updated_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=True)
-    last_login_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=True)
-    failed_login_attempts: Mapped[int] = Column(Integer, default=0)
-    is_locked: Mapped[bool] = Column(Boolean, default=False)
-    created_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
-    verification_token = Column(String, nullable=True)
-    email_verified: Mapped[bool] = Column(Boolean, default=False, nullable=False)
-    hashed_password: Mapped[str] = Column(String(255), nullable=False)
+    nickname: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    first_name: Mapped[str] = mapped_column(String(100), nullable=True)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=True)
+    bio: Mapped[str] = mapped_column(String(500), nullable=True)
+    profile_picture_url: Mapped[str] = mapped_column(String(255), nullable=True)
+    linkedin_profile_url: Mapped[str] = mapped_column(String(255), nullable=True)
+    github_profile_url: Mapped[str] = mapped_column(String(255), nullable=True)
+    location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Add location field
+    role: Mapped[UserRole] = mapped_column(SQLAlchemyEnum(UserRole, name='UserRole', create_constraint=True), nullable=False)
+    is_professional: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    professional_status_updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_login_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    failed_login_attempts: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    is_locked: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    # Timestamps are generated in Python so INSERT/UPDATE never need to read them back
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utc_now, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=_utc_now, server_default=func.now(), onupdate=_utc_now)
+    verification_token: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    email_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
 
 
     def __repr__(self) -> str:
@@ -92,13 +101,12 @@ class User(Base):
         self.profile_picture_url = profile_picture_url
         if location:
             self.location = location
-        self.updated_at = func.now()  # Ensure updated_at is refreshed
 
     # Method to update professional status (already present)
     def update_professional_status(self, status: bool):
         """Updates the professional status and logs the update time."""
         self.is_professional = status
-        self.professional_status_updated_at = func.now()
+        self.professional_status_updated_at = _utc_now()
 
     def lock_account(self):
         self.is_locked = True
@@ -112,7 +120,6 @@ class User(Base):
     def has_role(self, role_name: UserRole) -> bool:
         return self.role == role_name
 
-    def update_professional_status(self, status: bool):
-        """Updates the professional status and logs the update time."""
-        self.is_professional = status
-        self.professional_status_updated_at = func.now()
\ No newline at end of file
+
+# Case-insensitive email lookups in UserService.get_by_email compare lower(email)
+Index("ix_users_email_lower", func.lower(User.email))
@@ -23,8 +23,9 @@ from datetime import timedelta
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Response, status, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.dependencies import get_current_user, get_db, get_email_service, require_role
+from app.dependencies import get_current_user, get_db, get_email_service, require_role, require_role_from_token
 from app.schemas.pagination_schema import EnhancedPagination
 from app.schemas.token_schema import TokenResponse
 from app.schemas.user_schemas import LoginRequest, UserBase, UserCreate, UserListResponse, UserResponse, UserUpdate
@@ -38,10 +39,15 @@ from app.services.email_service import EmailService
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 settings = get_settings()
+# Built once so every admin/manager route shares the same dependency callables.
+# Routes that change data re-check the caller's role and lock flag in the database;
+# read-only routes trust the role claim of the token until it expires.
+require_admin_or_manager = require_role(["ADMIN", "MANAGER"])
+require_admin_or_manager_claims = require_role_from_token(["ADMIN", "MANAGER"])
 
 
 @router.get("/users/{user_id}", response_model=UserResponse, name="get_user", tags=["User Management Requires (Admin or Manager Roles)"])
-async def get_user(user_id: UUID, request: Request, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+async def get_user(user_id: UUID, request: Request, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme), current_user: dict = Depends(require_admin_or_manager_claims)):
     """
     Endpoint to fetch a user by their unique identifier (UUID).
 
@@ -83,7 +89,7 @@ async def get_user(user_id: UUID, request: Request, db: AsyncSession = Depends(g
 # experience by adhering to REST principles and providing self-discoverable operations.
 
 @router.put("/users/{user_id}", response_model=UserResponse, name="update_user", tags=["User Management Requires (Admin or Manager Roles)"])
-async def update_user(user_id: UUID, user_update: UserUpdate, request: Request, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+async def update_user(user_id: UUID, user_update: UserUpdate, request: Request, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme), current_user: Row = Depends(require_admin_or_manager)):
     """
     Update user information.
 
@@ -114,7 +120,7 @@ async def update_user(user_id: UUID, user_update: UserUpdate, request: Request,
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT, name="delete_user", tags=["User Management Requires (Admin or Manager Roles)"])
-async def delete_user(user_id: UUID, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+async def delete_user(user_id: UUID, db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme), current_user: Row = Depends(require_admin_or_manager)):
     """
     Delete a user by their ID.
 
@@ -128,7 +134,7 @@ async def delete_user(user_id: UUID, db: AsyncSession = Depends(get_db), token:
 
 
 @router.post("/users/", response_model=UserResponse, status_code=status.HTTP_201_CREATED, tags=["User Management Requires (Admin or Manager Roles)"], name="create_user")
-async def create_user(user: UserCreate, request: Request, db: AsyncSession = Depends(get_db), email_service: EmailService = Depends(get_email_service), token: str = Depends(oauth2_scheme), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+async def create_user(user: UserCreate, request: Request, db: AsyncSession = Depends(get_db), email_service: EmailService = Depends(get_email_service), token: str = Depends(oauth2_scheme), current_user: Row = Depends(require_admin_or_manager)):
     """
     Create a new user.
 
@@ -175,13 +181,27 @@ async def list_users(
     skip: int = 0,
     limit: int = 10,
     db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))
+    current_user: dict = Depends(require_admin_or_manager_claims)
 ):
     total_users = await UserService.count(db)
     users = await UserService.list_users(db, skip, limit)
 
+    # Rows read back from the database were validated when written, so build the
+    # responses without re-running the schema validators for every item on the page.
     user_responses = [
-        UserResponse.model_validate(user) for user in users
+        UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            nickname=user.nickname,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            bio=user.bio,
+            profile_picture_url=user.profile_picture_url,
+            linkedin_profile_url=user.linkedin_profile_url,
+            github_profile_url=user.github_profile_url,
+            role=user.role,
+            is_professional=user.is_professional
+        ) for user in users
     ]
 
     pagination_links = generate_pagination_links(request, skip, limit, total_users)
@@ -251,14 +271,14 @@ async def verify_email(user_id: UUID, token: str, db: AsyncSession = Depends(get
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired verification token")
 
 @router.put("/users/me", response_model=UserResponse, tags=["User Profile Management"])
-async def update_own_profile(user_update: UserUpdate, db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
+async def update_own_profile(user_update: UserUpdate, db: AsyncSession = Depends(get_db), current_user: Row = Depends(get_current_user)):
     """
     Allow the authenticated user to update their own profile information.
 
     - **user_update**: The UserUpdate model containing updated user information.
     """
     user_data = user_update.model_dump(exclude_unset=True)
-    updated_user = await UserService.update(db, current_user['id'], user_data)
+    updated_user = await UserService.update(db, current_user.id, user_data)
     if not updated_user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -279,7 +299,7 @@ async def update_own_profile(user_update: UserUpdate, db: AsyncSession = Depends
     )
 
 @router.put("/users/{user_id}/upgrade-professional", response_model=UserResponse, tags=["User Profile Management (Admin/Manager Only)"])
-async def upgrade_user_to_professional(user_id: UUID, db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+async def upgrade_user_to_professional(user_id: UUID, db: AsyncSession = Depends(get_db), current_user: Row = Depends(require_admin_or_manager)):
     """
     Allow admins or managers to upgrade a user's professional status.
 
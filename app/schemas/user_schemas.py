@@ -1,25 +1,45 @@
 from builtins import ValueError, any, bool, str
-from pydantic import BaseModel, EmailStr, Field, validator, root_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 import uuid
 import re
 from app.models.user_model import UserRole
-from app.utils.nickname_gen import generate_nickname
 
+# Fixed example value keeps the generated OpenAPI schema deterministic
+_EXAMPLE_NICK = "john_doe_123"
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_WHITESPACE_RE = re.compile(r"\s")
+
+
+def validate_email(email: Optional[str]) -> Optional[str]:
+    if email is None:
+        return email
+    if not _EMAIL_RE.fullmatch(email):
+        raise ValueError('Invalid email format')
+    # Normalize once here so lookups by email can compare directly
+    return email.lower()
 
 def validate_url(url: Optional[str]) -> Optional[str]:
     if url is None:
         return url
-    url_regex = r'^https?:\/\/[^\s/$.?#].[^\s]*$'
-    if not re.match(url_regex, url):
+    # Prefix check plus a single-character-class search instead of a backtracking regex.
+    # Like the previous pattern, the host must be at least two characters and must not
+    # start with one of "/$.?#", and the URL must not contain whitespace.
+    if url.startswith("https://"):
+        rest = url[8:]
+    elif url.startswith("http://"):
+        rest = url[7:]
+    else:
+        raise ValueError('Invalid URL format')
+    if len(rest) < 2 or rest[0] in "/$.?#" or _WHITESPACE_RE.search(url):
         raise ValueError('Invalid URL format')
     return url
 
 class UserBase(BaseModel):
-    email: EmailStr = Field(..., example="john.doe@example.com")
-    nickname: Optional[str] = Field(None, min_length=3, pattern=r'^[\w-]+$', example=generate_nickname())
+    email: str = Field(..., example="john.doe@example.com")
+    nickname: Optional[str] = Field(None, min_length=3, pattern=r'^[\w-]+$', example=_EXAMPLE_NICK)
     first_name: Optional[str] = Field(None, example="John")
     last_name: Optional[str] = Field(None, example="Doe")
     bio: Optional[str] = Field(None, example="Experienced software developer specializing in web applications.")
@@ -28,17 +48,24 @@ class UserBase(BaseModel):
     github_profile_url: Optional[str] = Field(None, example="https://github.com/johndoe")
     role: UserRole
 
-    _validate_urls = validator('profile_picture_url', 'linkedin_profile_url', 'github_profile_url', pre=True, allow_reuse=True)(validate_url)
+    model_config = ConfigDict(from_attributes=True)
 
-    class Config:
-        from_attributes = True
+    @field_validator('email')
+    @classmethod
+    def _validate_email(cls, email):
+        return validate_email(email)
+
+    @field_validator('profile_picture_url', 'linkedin_profile_url', 'github_profile_url', mode='before')
+    @classmethod
+    def _validate_urls(cls, url):
+        return validate_url(url)
 
 class UserCreate(UserBase):
-    email: EmailStr = Field(..., example="john.doe@example.com")
+    email: str = Field(..., example="john.doe@example.com")
     password: str = Field(..., example="Secure*1234")
 
 class UserUpdate(UserBase):
-    email: Optional[EmailStr] = Field(None, example="john.doe@example.com")
+    email: Optional[str] = Field(None, example="john.doe@example.com")
     nickname: Optional[str] = Field(None, min_length=3, pattern=r'^[\w-]+$', example="john_doe123")
     first_name: Optional[str] = Field(None, example="John")
     last_name: Optional[str] = Field(None, example="Doe")
@@ -48,7 +75,8 @@ class UserUpdate(UserBase):
     github_profile_url: Optional[str] = Field(None, example="https://github.com/johndoe")
     role: Optional[str] = Field(None, example="AUTHENTICATED")
 
-    @root_validator(pre=True)
+    @model_validator(mode='before')
+    @classmethod
     def check_at_least_one_value(cls, values):
         if not any(values.values()):
             raise ValueError("At least one field must be provided for update")
@@ -56,8 +84,8 @@ class UserUpdate(UserBase):
 
 class UserResponse(UserBase):
     id: uuid.UUID = Field(..., example=uuid.uuid4())
-    email: EmailStr = Field(..., example="john.doe@example.com")
-    nickname: Optional[str] = Field(None, min_length=3, pattern=r'^[\w-]+$', example=generate_nickname())
+    email: str = Field(..., example="john.doe@example.com")
+    nickname: Optional[str] = Field(None, min_length=3, pattern=r'^[\w-]+$', example=_EXAMPLE_NICK)
     is_professional: Optional[bool] = Field(default=False, example=True)
     role: UserRole
 
@@ -71,7 +99,7 @@ class ErrorResponse(BaseModel):
 
 class UserListResponse(BaseModel):
     items: List[UserResponse] = Field(..., example=[{
-        "id": uuid.uuid4(), "nickname": generate_nickname(), "email": "john.doe@example.com",
+        "id": uuid.uuid4(), "nickname": _EXAMPLE_NICK, "email": "john.doe@example.com",
         "first_name": "John", "bio": "Experienced developer", "role": "AUTHENTICATED",
         "last_name": "Doe", "bio": "Experienced developer", "role": "AUTHENTICATED",
         "profile_picture_url": "https://example.com/profiles/john.jpg",
@@ -83,7 +111,7 @@ class UserListResponse(BaseModel):
     size: int = Field(..., example=10)
 
 class UserUpdate(BaseModel):
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     bio: Optional[str] = None
@@ -91,5 +119,9 @@ class UserUpdate(BaseModel):
     location: Optional[str] = None
     password: Optional[str] = None  # Include password if it's to be updated
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator('email')
+    @classmethod
+    def _validate_email(cls, email):
+        return validate_email(email)
\ No newline at end of file
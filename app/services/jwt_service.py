@@ -1,9 +1,24 @@
 # app/services/jwt_service.py
 from builtins import dict, str
+import time
 import jwt
+from jwt.algorithms import get_default_algorithms
 from datetime import datetime, timedelta
 from settings.config import settings
 
+# Resolve the verification algorithm and key once at import; PyJWT would
+# otherwise re-prepare (and for asymmetric algorithms re-parse) the key on
+# every decode.
+_ALGORITHM = settings.jwt_algorithm
+_VERIFY_KEY = get_default_algorithms()[_ALGORITHM].prepare_key(settings.jwt_secret_key)
+
+# LRU cache of verified payloads keyed by (token, required claims), so clients
+# resending the same token skip signature verification until its "exp" passes.
+# Hits move to the end of the dict and the least recently used entry is evicted
+# once the cache is full. Cached payloads are shared and must not be mutated.
+_TOKEN_CACHE_SIZE = 4096
+_token_cache: dict = {}
+
 def create_access_token(*, data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     # Convert role to uppercase before encoding the JWT
@@ -14,9 +29,28 @@ def create_access_token(*, data: dict, expires_delta: timedelta = None):
     encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
-def decode_token(token: str):
+def decode_token(token: str, required: tuple = ("sub", "role", "exp")):
+    key = (token, required)
+    cached = _token_cache.pop(key, None)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > time.time():
+            _token_cache[key] = cached  # Re-insert as most recently used
+            return payload
     try:
-        decoded = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        return decoded
+        # PyJWT enforces presence of the required claims while verifying, so
+        # callers can index the payload directly instead of re-checking it.
+        decoded = jwt.decode(
+            token,
+            _VERIFY_KEY,
+            algorithms=[_ALGORITHM],
+            options={"require": list(required), "verify_signature": True},
+        )
     except jwt.PyJWTError:
         return None
+    # Tokens without an expiry are never cached since they could not be invalidated
+    if "exp" in decoded:
+        _token_cache[key] = (decoded["exp"], decoded)
+        if len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.pop(next(iter(_token_cache)))
+    return decoded
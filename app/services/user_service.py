@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 import secrets
 from typing import Optional, Dict, List
 from pydantic import EmailStr, ValidationError
-from sqlalchemy import func, null, update, select
+from sqlalchemy import Row, func, null, update, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.dependencies import get_email_service, get_settings
@@ -41,13 +41,32 @@ class UserService:
     async def get_by_id(cls, session: AsyncSession, user_id: UUID) -> Optional[User]:
         return await cls._fetch_user(session, id=user_id)
 
+    @classmethod
+    async def get_identity(cls, session: AsyncSession, user_id: UUID) -> Optional[Row]:
+        """
+        Fetch only the columns needed to authorize a request (id, role, is_locked).
+
+        :param session: The AsyncSession instance for database access.
+        :param user_id: The user's ID. get_current_user passes the token's "sub" claim here,
+            which is not always a UUID (login puts the user's email there).
+        :return: A row with the identity columns, or None if no user has that ID
+            (including when user_id is not a valid UUID).
+        """
+        query = select(User.id, User.role, User.is_locked).where(User.id == user_id)
+        result = await cls._execute_query(session, query)
+        return result.first() if result else None
+
     @classmethod
     async def get_by_nickname(cls, session: AsyncSession, nickname: str) -> Optional[User]:
         return await cls._fetch_user(session, nickname=nickname)
 
     @classmethod
     async def get_by_email(cls, session: AsyncSession, email: str) -> Optional[User]:
-        return await cls._fetch_user(session, email=email)
+        # New emails are stored lowercased by the user schemas, but older rows may keep a
+        # mixed-case local part, so compare case-insensitively (backed by ix_users_email_lower)
+        query = select(User).where(func.lower(User.email) == email.lower())
+        result = await cls._execute_query(session, query)
+        return result.scalars().first() if result else None
 
     @classmethod
     async def create(cls, session: AsyncSession, user_data: Dict[str, str], email_service: Optional[EmailService] = None) -> Optional[User]:
@@ -104,7 +123,6 @@ class UserService:
             # Fetch the updated user
             updated_user = await cls.get_by_id(session, user_id)
             if updated_user:
-                session.refresh(updated_user)  # Refresh the updated user object
                 logger.info(f"User {user_id} updated successfully.")
                 return updated_user
             else:
@@ -229,7 +247,6 @@ class UserService:
             # Fetch the updated user to return
             updated_user = await cls.get_by_id(session, user_id)
             if updated_user:
-                session.refresh(updated_user)  # Explicitly refresh the updated user object
                 logger.info(f"User {user_id} updated profile successfully.")
                 return updated_user
             else:
@@ -248,7 +265,6 @@ class UserService:
             # Fetch the updated user to return
             updated_user = await cls.get_by_id(session, user_id)
             if updated_user:
-                session.refresh(updated_user)
                 logger.info(f"User {user_id} professional status updated successfully.")
                 return updated_user
             else:
@@ -0,0 +1,20 @@
+from datetime import timedelta
+import pytest
+from fastapi import HTTPException
+from app.dependencies import get_current_user
+from app.services.jwt_service import create_access_token
+
+def _token_for(user):
+    return create_access_token(data={"sub": str(user.id), "role": user.role.name}, expires_delta=timedelta(minutes=30))
+
+@pytest.mark.asyncio
+async def test_get_current_user_returns_identity(db_session, verified_user):
+    current_user = await get_current_user(token=_token_for(verified_user), db=db_session)
+    assert current_user.id == verified_user.id
+    assert current_user.role == verified_user.role
+
+@pytest.mark.asyncio
+async def test_get_current_user_rejects_locked_user(db_session, locked_user):
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(token=_token_for(locked_user), db=db_session)
+    assert exc_info.value.status_code == 401
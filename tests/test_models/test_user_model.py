@@ -38,7 +38,7 @@ async def test_failed_login_attempts_increment(db_session: AsyncSession, user: U
     initial_attempts = user.failed_login_attempts
     user.failed_login_attempts += 1
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["failed_login_attempts"])
     assert user.failed_login_attempts == initial_attempts + 1, "Failed login attempts should increment"
 
 @pytest.mark.asyncio
@@ -49,7 +49,7 @@ async def test_last_login_update(db_session: AsyncSession, user: User):
     new_last_login = datetime.now(timezone.utc)
     user.last_login_at = new_last_login
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["last_login_at"])
     assert user.last_login_at == new_last_login, "Last login timestamp should update correctly"
 
 @pytest.mark.asyncio
@@ -63,13 +63,13 @@ async def test_account_lock_and_unlock(db_session: AsyncSession, user: User):
     # Lock the account and verify.
     user.lock_account()
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["is_locked"])
     assert user.is_locked, "Account should be locked after calling lock_account()"
 
     # Unlock the account and verify.
     user.unlock_account()
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["is_locked"])
     assert not user.is_locked, "Account should be unlocked after calling unlock_account()"
 
 @pytest.mark.asyncio
@@ -83,7 +83,7 @@ async def test_email_verification(db_session: AsyncSession, user: User):
     # Verify the email and check.
     user.verify_email()
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["email_verified"])
     assert user.email_verified, "Email should be verified after calling verify_email()"
 
 @pytest.mark.asyncio
@@ -97,7 +97,7 @@ async def test_user_profile_pic_url_update(db_session: AsyncSession, user: User)
     profile_pic_url = "http://myprofile/picture.png"
     user.profile_picture_url = profile_pic_url
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["profile_picture_url"])
     assert user.profile_picture_url == profile_pic_url, "The profile pic did not update"
 
 @pytest.mark.asyncio
@@ -111,7 +111,7 @@ async def test_user_linkedin_url_update(db_session: AsyncSession, user: User):
     profile_linkedin_url = "http://www.linkedin.com/profile"
     user.linkedin_profile_url = profile_linkedin_url
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["linkedin_profile_url"])
     assert user.linkedin_profile_url == profile_linkedin_url, "The profile pic did not update"
 
 
@@ -126,7 +126,7 @@ async def test_user_github_url_update(db_session: AsyncSession, user: User):
     profile_github_url = "http://www.github.com/profile"
     user.github_profile_url = profile_github_url
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["github_profile_url"])
     assert user.github_profile_url == profile_github_url, "The github did not update"
 
 
@@ -137,5 +137,5 @@ async def test_update_user_role(db_session: AsyncSession, user: User):
     """
     user.role = UserRole.ADMIN
     await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.refresh(user, attribute_names=["role"])
     assert user.role == UserRole.ADMIN, "Role update should persist correctly in the database"
@@ -103,8 +103,20 @@ def test_user_base_url_valid(url, user_base_data):
     user = UserBase(**user_base_data)
     assert user.profile_picture_url == url
 
-@pytest.mark.parametrize("url", ["ftp://invalid.com/profile.jpg", "http//invalid", "https//invalid"])
+@pytest.mark.parametrize("url", ["ftp://invalid.com/profile.jpg", "http//invalid", "https//invalid", "http://.com", "http://a", "http://in valid.com"])
 def test_user_base_url_invalid(url, user_base_data):
     user_base_data["profile_picture_url"] = url
     with pytest.raises(ValidationError):
         UserBase(**user_base_data)
+
+@pytest.mark.parametrize("email", ["john.doe@example.com", "John.Doe@Example.COM", "a+tag@sub.example.org"])
+def test_user_base_email_valid(email, user_base_data):
+    user_base_data["email"] = email
+    user = UserBase(**user_base_data)
+    assert user.email == email.lower()
+
+@pytest.mark.parametrize("email", ["notanemail", "john@doe", "john doe@example.com", "@example.com", "john.doe@example.com\n"])
+def test_user_base_email_invalid(email, user_base_data):
+    user_base_data["email"] = email
+    with pytest.raises(ValidationError):
+        UserBase(**user_base_data)
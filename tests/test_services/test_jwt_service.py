@@ -0,0 +1,44 @@
+import time
+import jwt
+from datetime import datetime, timedelta
+from app.services import jwt_service
+from app.services.jwt_service import create_access_token, decode_token
+from settings.config import settings
+
+def test_decode_token_valid():
+    token = create_access_token(data={"sub": "user@example.com", "role": "authenticated"})
+    payload = decode_token(token)
+    assert payload["sub"] == "user@example.com"
+    assert payload["role"] == "AUTHENTICATED"
+
+def test_decode_token_missing_required_claim():
+    expire = datetime.utcnow() + timedelta(minutes=5)
+    token = jwt.encode({"sub": "user@example.com", "exp": expire}, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    assert decode_token(token) is None
+
+def test_decode_token_invalid_signature():
+    token = create_access_token(data={"sub": "user@example.com", "role": "ADMIN"})
+    assert decode_token(token + "tampered") is None
+
+def test_decode_token_reuses_cached_payload():
+    token = create_access_token(data={"sub": "user@example.com", "role": "ADMIN"})
+    assert decode_token(token) is decode_token(token)
+
+def test_decode_token_drops_expired_cache_entry():
+    token = create_access_token(data={"sub": "user@example.com", "role": "ADMIN"}, expires_delta=timedelta(seconds=-1))
+    key = (token, ("sub", "role", "exp"))
+    jwt_service._token_cache[key] = (time.time() - 1, {"sub": "user@example.com", "role": "ADMIN"})
+    assert decode_token(token) is None
+    assert key not in jwt_service._token_cache
+
+def test_decode_token_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(jwt_service, "_TOKEN_CACHE_SIZE", 2)
+    monkeypatch.setattr(jwt_service, "_token_cache", {})
+    first, second, third = (create_access_token(data={"sub": f"user{i}@example.com", "role": "ADMIN"}) for i in range(3))
+    decode_token(first)
+    decode_token(second)
+    decode_token(first)  # first becomes the most recently used entry
+    decode_token(third)
+    cached_tokens = [token for token, _ in jwt_service._token_cache]
+    assert len(cached_tokens) == 2
+    assert cached_tokens == [first, third]
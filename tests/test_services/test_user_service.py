@@ -5,6 +5,7 @@ from app.dependencies import get_settings
 from app.models.user_model import User, UserRole
 from app.services.user_service import UserService
 from app.utils.nickname_gen import generate_nickname
+from app.utils.security import hash_password
 
 pytestmark = pytest.mark.asyncio
 
@@ -41,6 +42,18 @@ async def test_get_by_id_user_does_not_exist(db_session):
     retrieved_user = await UserService.get_by_id(db_session, non_existent_user_id)
     assert retrieved_user is None
 
+# Test fetching the identity columns of an existing user
+async def test_get_identity_user_exists(db_session, user):
+    identity = await UserService.get_identity(db_session, user.id)
+    assert identity.id == user.id
+    assert identity.role == user.role
+    assert identity.is_locked == user.is_locked
+
+# Test fetching the identity of a user that does not exist
+async def test_get_identity_user_does_not_exist(db_session):
+    identity = await UserService.get_identity(db_session, "non-existent-id")
+    assert identity is None
+
 # Test fetching a user by nickname when the user exists
 async def test_get_by_nickname_user_exists(db_session, user):
     retrieved_user = await UserService.get_by_nickname(db_session, user.nickname)
@@ -122,6 +135,27 @@ async def test_login_user_successful(db_session, verified_user):
     logged_in_user = await UserService.login_user(db_session, user_data["email"], user_data["password"])
     assert logged_in_user is not None
 
+# Test user login matches the stored (lowercased) email regardless of the case typed
+async def test_login_user_email_case_insensitive(db_session, verified_user):
+    logged_in_user = await UserService.login_user(db_session, verified_user.email.upper(), "MySuperPassword$1234")
+    assert logged_in_user is not None
+
+# Test lookups still match rows stored before emails were lowercased on write
+async def test_login_user_mixed_case_stored_email(db_session):
+    user = User(
+        nickname=generate_nickname(),
+        email="John.Doe@example.com",
+        hashed_password=hash_password("MySuperPassword$1234"),
+        role=UserRole.AUTHENTICATED,
+        email_verified=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    assert await UserService.get_by_email(db_session, "john.doe@example.com") is not None
+    logged_in_user = await UserService.login_user(db_session, "john.doe@example.com", "MySuperPassword$1234")
+    assert logged_in_user is not None
+    assert not await UserService.is_account_locked(db_session, "JOHN.DOE@EXAMPLE.COM")
+
 # Test user login with incorrect email
 async def test_login_user_incorrect_email(db_session):
     user = await UserService.login_user(db_session, "nonexistentuser@noway.com", "Password123!")